@@ -16,14 +16,17 @@ from __future__ import annotations
 
 import json
 import logging
+import re
 import subprocess
 import sys
 from pathlib import Path
-
-from pandas import DataFrame
+from typing import TYPE_CHECKING
 
 from . import audio, preprocess, resources
 
+if TYPE_CHECKING:
+    from pandas import DataFrame
+
 __version__ = "0.1.2"
 
 
@@ -59,14 +62,23 @@ def setup_logger(logger_: logging.Logger, outdir='.', label=None, log_level='INF
     logger_.propagate = False
     logger_.setLevel(level)
 
-    if not any(isinstance(h, logging.StreamHandler) for h in logger_.handlers):
+    # FileHandler is a subclass of StreamHandler, so check it first.
+    has_stream_handler = False
+    has_file_handler = False
+    for handler in logger_.handlers:
+        if isinstance(handler, logging.FileHandler):
+            has_file_handler = True
+        elif isinstance(handler, logging.StreamHandler):
+            has_stream_handler = True
+
+    if not has_stream_handler:
         stream_handler = logging.StreamHandler()
         stream_handler.setFormatter(logging.Formatter(
             '%(asctime)s %(name)s %(levelname)-8s: %(message)s', datefmt='%H:%M'))
         stream_handler.setLevel(level)
         logger_.addHandler(stream_handler)
 
-    if not any(isinstance(h, logging.FileHandler) for h in logger_.handlers):
+    if not has_file_handler:
         if label:
             Path(outdir).mkdir(parents=True, exist_ok=True)
             log_file = f'{outdir}/{label}.log'
@@ -99,12 +111,67 @@ def loaded_modules_dict() -> dict:
     return vdict
 
 
+def _read_conda_meta(conda_meta: Path) -> list:
+    """Read the package records of a Conda environment.
+
+    These are the same ``conda-meta/*.json`` files that ``conda list`` reads,
+    without the cost of starting conda.
+
+    Args:
+        conda_meta (Path): The ``conda-meta`` directory of the environment.
+
+    Returns:
+        list: A `list` of `dict`, one for each package, with ``'name'`` and ``'version'`` keys.
+    """
+    pkgs = []
+    for path in sorted(conda_meta.glob("*.json")):
+        record = json.loads(path.read_bytes())
+        pkgs.append({"name": record["name"], "version": record["version"]})
+    return pkgs
+
+
+def _canonical_name(name: str) -> str:
+    """Normalize a package name, so that conda and pip spellings of it compare equal.
+
+    Args:
+        name (str): Name of the package.
+
+    Returns:
+        str: Lowercase name with runs of ``-``, ``_`` and ``.`` replaced by ``-``.
+    """
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _read_distributions() -> list:
+    """Read the distributions installed on the import path.
+
+    These are the same ``*.dist-info`` records that ``pip list`` reads,
+    without the cost of starting another interpreter.
+
+    Returns:
+        list: A `list` of `dict`, one for each package, sorted by name.
+    """
+    # importlib.metadata pulls in email and zipfile, so only load it when needed.
+    from importlib.metadata import distributions  # pylint: disable=import-outside-toplevel
+
+    pkgs = {}
+    for dist in distributions():
+        name = dist.metadata.get("Name")
+        # Like pip, the first distribution on the path shadows later ones.
+        if name and name.lower() not in pkgs:
+            pkgs[name.lower()] = {"name": name, "version": dist.version}
+    return [pkgs[key] for key in sorted(pkgs)]
+
+
 def env_package_list(as_dataframe: bool = False) -> list | DataFrame:
     """Get the list of packages installed in the system prefix.
 
     If it is detected that the system prefix is part of a Conda environment,
-    a call to ``conda list --prefix {sys.prefix}`` will be made, otherwise
-    the call will be to ``{sys.executable} -m pip list installed``.
+    the package records in ``{sys.prefix}/conda-meta`` are read together with the
+    distributions installed by pip, falling back to
+    ``conda list --prefix {sys.prefix}`` if they cannot be parsed, otherwise
+    the installed distributions are read with `importlib.metadata`, falling
+    back to ``{sys.executable} -m pip list installed`` if none are found.
 
     Args:
         as_dataframe (bool): return output as a `pandas.DataFrame`
@@ -113,16 +180,28 @@ def env_package_list(as_dataframe: bool = False) -> list | DataFrame:
     Union[list, DataFrame]:
         If ``as_dataframe=False`` is given, the output is a `list` of `dict`,
         one for each package, at least with ``'name'`` and ``'version'`` keys
-        (more if `conda` is used).
+        (more if ``conda list`` has to be called).
         If ``as_dataframe=True`` is given, the output is a `DataFrame`
         created from the `list` of `dicts`.
     """
     prefix = sys.prefix
     pkgs = []
     # if a conda-meta directory exists, this is a conda environment, so
-    # use conda to print the package list
-    conda_detected = (Path(prefix) / "conda-meta").is_dir()
+    # read the package records conda keeps there
+    conda_meta = Path(prefix) / "conda-meta"
+    conda_detected = conda_meta.is_dir()
     if conda_detected:
+        try:
+            pkgs = _read_conda_meta(conda_meta)
+        except (OSError, ValueError, KeyError):
+            pkgs = []
+        if pkgs:
+            # packages installed with pip have no conda-meta record, but
+            # conda list shows them too
+            conda_names = {_canonical_name(pkg["name"]) for pkg in pkgs}
+            pkgs += [pkg for pkg in _read_distributions() if _canonical_name(pkg["name"]) not in conda_names]
+    if conda_detected and not pkgs:
+        # the records could not be read, so ask conda itself
         try:
             pkgs = json.loads(subprocess.check_output([
                 "conda",
@@ -134,8 +213,12 @@ def env_package_list(as_dataframe: bool = False) -> list | DataFrame:
             # When a conda env is in use but conda is unavailable
             conda_detected = False
 
-    # otherwise try and use Pip
+    # otherwise read the installed distributions
     if not conda_detected:
+        pkgs = _read_distributions()
+
+    # and if there are none, try and use Pip
+    if not conda_detected and not pkgs:
         try:
             import pip  # noqa: F401 # pylint: disable=unused-import, import-outside-toplevel
         except ModuleNotFoundError:  # no pip?
@@ -153,6 +236,8 @@ def env_package_list(as_dataframe: bool = False) -> list | DataFrame:
 
     # convert to recarray for storage
     if as_dataframe:
+        # pandas is slow to import, so only load it when a DataFrame is requested.
+        from pandas import DataFrame  # pylint: disable=import-outside-toplevel,redefined-outer-name
         return DataFrame(pkgs)
     return pkgs
 
@@ -27,18 +27,18 @@ def validate_audio_arguments(rate: float, volume: float, voice: int | str | None
     Returns:
         dict: rate, volume, voice, pause_seconds
     """
-    engine = pyttsx3.init()
-    available_voices = engine.getProperty('voices')
     rate = max(50, min(500, rate))
     volume = max(0.0, min(1.0, volume))
-    if isinstance(voice, int):
-        if 0 <= voice < len(available_voices):
-            voice = available_voices[voice].id
-        else:
-            voice = None
-            logger.error('Invalid voice index = %s. Keeping current voice.', voice)
-    elif isinstance(voice, str):
-        if voice not in [v.id for v in available_voices]:
+    if isinstance(voice, (int, str)):
+        # Only start an engine when there is a voice to look up.
+        available_voices = pyttsx3.init().getProperty('voices')
+        if isinstance(voice, int):
+            if 0 <= voice < len(available_voices):
+                voice = available_voices[voice].id
+            else:
+                voice = None
+                logger.error('Invalid voice index = %s. Keeping current voice.', voice)
+        elif not any(v.id == voice for v in available_voices):
             voice = None
             logger.error('Invalid voice ID = %s. Keeping current voice.', voice)
     elif voice is not None:
@@ -81,15 +81,46 @@ class Audio:
             volume = arguments['volume']
             voice = arguments['voice']
             pause_seconds = arguments['pause_seconds']
-        self.engine = pyttsx3.init()
-        if rate is not None:
-            self.engine.setProperty('rate', rate)
-        if volume is not None:
-            self.engine.setProperty('volume', volume)
-        if voice is not None:
-            self.engine.setProperty('voice', voice)
+        # The engine is initialized on first use, so these are applied then.
+        self._engine = None
+        self._rate = rate
+        self._volume = volume
+        self._voice = voice
         self.pause_seconds = pause_seconds
 
+    @property
+    def engine(self) -> pyttsx3.Engine:
+        """Get the text-to-speech engine.
+
+        The engine is initialized on first access, since loading the driver is slow.
+
+        Returns:
+            pyttsx3.Engine: The text-to-speech engine.
+        """
+        return self.warm_up()
+
+    def warm_up(self) -> pyttsx3.Engine:
+        """Initialize the text-to-speech engine ahead of its first use.
+
+        The engine is bound to the thread that initializes it, so call this from the thread that reads aloud.
+
+        Returns:
+            pyttsx3.Engine: The text-to-speech engine.
+        """
+        if self._engine is None:
+            self._engine = pyttsx3.init()
+            self._apply_pending_settings()
+        return self._engine
+
+    def _apply_pending_settings(self):
+        """Apply the settings given before the engine was initialized."""
+        if self._rate is not None:
+            self._engine.setProperty('rate', self._rate)
+        if self._volume is not None:
+            self._engine.setProperty('volume', self._volume)
+        if self._voice is not None:
+            self._engine.setProperty('voice', self._voice)
+
     @property
     def available_voices(self) -> list:
         """Get the available voices.
@@ -128,7 +159,7 @@ class Audio:
     def clean_text(self, text: str) -> str:
         """Clean the text for smoother reading.
 
-        '\\n' is replaced with a white space.
+        Runs of whitespace, including '\\n', are collapsed into a single white space.
 
         Args:
             text (str): Text.
@@ -136,7 +167,7 @@ class Audio:
         Returns:
             str: Cleaned text.
         """
-        return " ".join(text.split()).replace('\n', ' ').strip()
+        return " ".join(text.split())
 
     def read_article(self,
                      article: str):
@@ -153,7 +184,8 @@ class Audio:
         for sentence in sentences:
             self.engine.say(sentence)
             self.engine.runAndWait()
-            time.sleep(self.pause_seconds)
+            if self.pause_seconds > 0:
+                time.sleep(self.pause_seconds)
 
     def save_article(self,
                      filename: str,
@@ -170,4 +202,5 @@ class Audio:
 
     def stop(self):
         """Stop the current speech."""
-        self.engine.stop()
+        if self._engine is not None:
+            self._engine.stop()
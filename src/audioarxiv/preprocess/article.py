@@ -3,20 +3,55 @@ Functions to preprocess articles.
 """
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
 import nltk
 from nltk.tokenize import sent_tokenize
 
-# Download tokenizer if needed
-nltk.download('punkt_tab')
+
+def _ensure_punkt():
+    """Download the Punkt sentence tokenizer unless it is already installed."""
+    try:
+        nltk.data.find('tokenizers/punkt_tab')
+    except LookupError:
+        nltk.download('punkt_tab')
+
+
+_ensure_punkt()
+
+# Punkt only considers splitting after these characters.
+_SENTENCE_END_RE = re.compile(r"[.?!]")
+
+
+@lru_cache(maxsize=256)
+def _get_sentences_cached(text: str) -> tuple:
+    """Get the sentences from the text, caching the result.
+
+    Args:
+        text (str): Text.
+
+    Returns:
+        tuple: A tuple of sentences.
+    """
+    return tuple(sent_tokenize(text))
 
 
 def get_sentences(text: str) -> list:
     """Get the sentences from the text.
 
+    The tokenization is cached, so re-reading the same passage does not split it again.
+    Text without any sentence-ending punctuation, such as a section header, is returned as a single
+    sentence without running the tokenizer.
+
     Args:
         text (str): Text.
 
     Returns:
         list: A list of sentences.
     """
-    return sent_tokenize(text)
+    if _SENTENCE_END_RE.search(text) is None:
+        # Same result as the tokenizer: one sentence, with trailing whitespace removed.
+        text = text.rstrip()
+        return [text] if text else []
+    return list(_get_sentences_cached(text))
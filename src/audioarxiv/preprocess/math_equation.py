@@ -4,9 +4,47 @@ Functions to preprocess math equations.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
-from sympy import srepr
-from sympy.parsing.sympy_parser import parse_expr
+# Block math ($$...$$).
+_BLOCK_MATH_RE = re.compile(r"\$\$(.+?)\$\$")
+# Inline math ($...$), only if it is surrounded by non-word characters (to avoid $5).
+_INLINE_MATH_RE = re.compile(r"(?<!\w)\$(.+?)\$(?!\w)")
+
+
+@lru_cache(maxsize=4096)
+def _readable(raw_expr: str) -> str:
+    """Convert a single math expression to a readable format.
+
+    The result is cached because papers repeat the same symbols many times.
+
+    Args:
+        raw_expr (str): Math expression without the surrounding dollar signs.
+
+    Returns:
+        str: Readable expression.
+    """
+    # sympy is slow to import, so only load it when there is math to convert.
+    from sympy import srepr  # pylint: disable=import-outside-toplevel
+    from sympy.parsing.sympy_parser import parse_expr  # pylint: disable=import-outside-toplevel
+
+    try:
+        parsed = parse_expr(raw_expr)
+        return f"Math: {srepr(parsed)}"
+    except Exception:
+        return f"Equation: {raw_expr}"
+
+
+def _replace_math(match: re.Match) -> str:
+    """Replacement callback for the math regexes.
+
+    Args:
+        match (re.Match): Match with the expression in the first group.
+
+    Returns:
+        str: Readable expression.
+    """
+    return _readable(match.group(1))
 
 
 def process_math_equations(text: str) -> str:
@@ -18,19 +56,11 @@ def process_math_equations(text: str) -> str:
     Returns:
         str: Text with the processed math equations.
     """
+    if '$' not in text:
+        return text
 
-    def replace_math(match: re.Match) -> str:
-        raw_expr = match.group(1)
-        try:
-            parsed = parse_expr(raw_expr)
-            return f"Math: {srepr(parsed)}"
-        except Exception:
-            return f"Equation: {raw_expr}"
-
-    # First replace block math ($$...$$)
-    text = re.sub(r"\$\$(.+?)\$\$", replace_math, text)
-
-    # Then replace inline math, match $...$ only if it's surrounded by non-digit characters (to avoid $5)
-    text = re.sub(r"(?<!\w)\$(.+?)\$(?!\w)", replace_math, text)
+    # First replace block math, then inline math.
+    text = _BLOCK_MATH_RE.sub(_replace_math, text)
+    text = _INLINE_MATH_RE.sub(_replace_math, text)
 
     return text
@@ -4,15 +4,94 @@ A class to fetch papers from arXiv.
 from __future__ import annotations
 
 import logging
+import os
 import re
-import tempfile
+import time
 from datetime import datetime
+from pathlib import Path
+from typing import Iterator
 
 import arxiv
 import fitz
+from platformdirs import user_cache_dir
 
 logger = logging.getLogger('audioarxiv')
 
+# Numbered section headers, e.g. "1 Introduction" or "2.3 Results".
+_HEADER_NUM_RE = re.compile(r"^\d+(\.\d+)*\s+\w+")
+
+# Carriage returns and form feeds become spaces; soft hyphens are dropped.
+_BLOCK_TEXT_TABLE = str.maketrans({"\r": " ", "\x0c": " ", "\xad": ""})
+
+# Temporary download files untouched for this many seconds were left behind by an interrupted download.
+_STALE_DOWNLOAD_SECONDS = 3600
+
+
+def is_section_header(text: str) -> bool:
+    """Check whether a text block looks like a section header.
+
+    A block is treated as a header if it is uppercase, numbered (e.g. "2.1 Methods"), or ends with a colon.
+
+    Args:
+        text (str): Stripped text of a PDF block.
+
+    Returns:
+        bool: True if the block is a section header.
+    """
+    # Cheapest checks first; the numbering regex only runs on blocks that start with a digit.
+    return (text.endswith(":")
+            or text.isupper()
+            or (text[:1].isdigit() and _HEADER_NUM_RE.match(text) is not None))
+
+
+def extract_page_texts(page: fitz.Page) -> list:
+    """Extract the text blocks of a PDF page.
+
+    Carriage returns and form feeds are replaced with spaces and soft hyphens are removed.
+
+    Args:
+        page (fitz.Page): PDF page.
+
+    Returns:
+        list: Stripped text of each block on the page.
+    """
+    # Extract text blocks, joining words hyphenated across line breaks
+    blocks = page.get_text("blocks",  # type: ignore[attr-defined]
+                           flags=fitz.TEXTFLAGS_BLOCKS | fitz.TEXT_DEHYPHENATE)
+    return [block[4].translate(_BLOCK_TEXT_TABLE).strip() for block in blocks]
+
+
+def extract_page_blocks(page: fitz.Page) -> tuple:
+    """Extract the text blocks of a PDF page and classify them.
+
+    Args:
+        page (fitz.Page): PDF page.
+
+    Returns:
+        tuple: The stripped text of each block, and a list of flags telling whether each block is a section header.
+    """
+    texts = extract_page_texts(page)
+    return texts, list(map(is_section_header, texts))
+
+
+def _remove_stale_downloads(cache_dir: Path):
+    """Remove the temporary files left behind by interrupted downloads.
+
+    Files modified in the last `_STALE_DOWNLOAD_SECONDS` are kept,
+    since they may belong to a download still running in another process.
+
+    Args:
+        cache_dir (Path): Directory of the cached PDFs.
+    """
+    cutoff = time.time() - _STALE_DOWNLOAD_SECONDS
+    for tmp_path in cache_dir.glob('*.tmp'):
+        try:
+            if tmp_path.stat().st_mtime < cutoff:
+                tmp_path.unlink()
+        except OSError:
+            # Removed by another process in the meantime, or still open on Windows.
+            pass
+
 
 def validate_paper_arguments(page_size: int,
                              delay_seconds: float,
@@ -33,6 +112,15 @@ def validate_paper_arguments(page_size: int,
     Returns:
         dict: paper_size, delay_seconds, num_retries
     """
+    if not 1 <= page_size <= 2000:
+        logger.error('page_size = %s must be between 1 and 2000. Clipping it to the range.', page_size)
+        page_size = max(1, min(2000, page_size))
+    if delay_seconds < 0:
+        logger.error('delay_seconds = %s must be non-negative. Using 0.', delay_seconds)
+        delay_seconds = 0.0
+    if num_retries < 0:
+        logger.error('num_retries = %s must be non-negative. Using 0.', num_retries)
+        num_retries = 0
     return {'page_size': page_size,
             'delay_seconds': delay_seconds,
             'num_retries': num_retries}
@@ -164,6 +252,85 @@ class Paper:
         logger.error('Paper is None. Cannot download PDF.')
         return None
 
+    def _download_pdf_to_cache(self) -> str:
+        """Download the PDF to the user cache directory unless it is already there.
+
+        The file is named after the versioned arXiv ID, so a new version of the paper is downloaded again.
+        It is downloaded to a temporary file that then replaces the cached PDF,
+        so an interrupted download never leaves a truncated PDF in the cache.
+        Temporary files left behind by earlier interrupted downloads are removed first.
+
+        Returns:
+            str: Path of the cached PDF.
+        """
+        cache_dir = Path(user_cache_dir('audioarxiv')) / 'pdf'
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Old-style IDs such as quant-ph/0201082v1 contain a slash.
+        filename = f"{self.paper.get_short_id().replace('/', '_')}.pdf"
+        path = cache_dir / filename
+        if not path.exists():
+            _remove_stale_downloads(cache_dir)
+            tmp_path = cache_dir / f'{filename}.{os.getpid()}.tmp'
+            try:
+                self.download_pdf(dirpath=str(cache_dir), filename=tmp_path.name)
+                os.replace(tmp_path, path)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+        else:
+            logger.debug('Using cached PDF %s.', path)
+        return str(path)
+
+    def iter_sections(self) -> Iterator[dict]:
+        """Iterate over the sections of the paper as they are parsed.
+
+        Each section is yielded as soon as the next header is found, so the caller can start working on it
+        before the rest of the PDF has been processed. Once the iteration completes, the sections are cached
+        and also available from `sections`.
+
+        Yields:
+            dict: A section with the header as the key and the content as the value.
+        """
+        if len(self._sections) > 0:
+            yield from self._sections
+            return
+        if self.paper is None:
+            logger.error('Paper is None. Cannot download PDF.')
+            return
+        filename = self._download_pdf_to_cache()
+
+        sections = []
+        # Track the current section in locals and build its dict once it is complete.
+        header = None
+        content = []
+
+        with fitz.open(filename) as doc:
+            for page in doc:
+                texts, header_flags = extract_page_blocks(page)
+                for text, is_header in zip(texts, header_flags):
+                    if is_header:
+
+                        # Store previous section before switching
+                        if header or content:
+                            section = {"header": header, "content": content}
+                            sections.append(section)
+                            yield section
+
+                        # New section
+                        header = text
+                        content = []
+                    else:
+                        content.append(text)
+
+        # Append the last section
+        if header or content:
+            section = {"header": header, "content": content}
+            sections.append(section)
+            yield section
+
+        # Only cache the sections once the whole paper has been parsed.
+        self._sections = sections
+
     @property
     def sections(self) -> list:
         """Get the sections of the paper.
@@ -172,36 +339,6 @@ class Paper:
             list: A list of sections. Each section is a dict with the header as the key and the content as the value.
         """
         if len(self._sections) == 0:
-            if self.paper is None:
-                logger.error('Paper is None. Cannot download PDF.')
-                return self._sections
-            with tempfile.NamedTemporaryFile() as tmp:
-                filename = tmp.name
-                self.download_pdf(filename=filename)
-
-                doc = fitz.open(filename)
-
-                current_section = {"header": None, "content": []}
-
-                for page in doc:
-                    blocks = page.get_text("blocks")  # Extract text blocks # type: ignore[attr-defined]
-
-                    for block in blocks:
-                        text = block[4].strip()
-
-                        # Detect section headers using common patterns (uppercase, numbered, bold)
-                        if (text.isupper() or re.match(r"^\d+(\.\d+)*\s+\w+", text) or text.endswith(":")):
-
-                            # Store previous section before switching
-                            if current_section["header"] or current_section["content"]:
-                                self._sections.append(current_section)
-
-                            current_section = {"header": text, "content": []}  # New section
-                        else:
-                            current_section["content"].append(text)
-
-                # Append the last section
-                if current_section["header"] or current_section["content"]:
-                    self._sections.append(current_section)
-
+            for _ in self.iter_sections():
+                pass
         return self._sections
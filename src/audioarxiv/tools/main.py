@@ -3,14 +3,18 @@ A command line tool to fetch arXiv papers and read aloud.
 """
 from __future__ import annotations
 
+import argparse
+import contextlib
 import json
 import logging
 import os
+import queue
 import signal
 import sys
-import time
+import threading
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
 
-import configargparse
 from platformdirs import user_config_dir
 
 from ..audio.base import Audio, validate_audio_arguments
@@ -30,33 +34,127 @@ def handle_exit(sig_num: int , frame: object):  # noqa: ARG001 # pylint: disable
     sys.exit(0)
 
 
+def prefetch(iterable: Iterable, maxsize: int = 2) -> Iterator:
+    """Iterate over an iterable that is consumed in a background thread.
+
+    Up to `maxsize` items are produced ahead of the consumer, so slow production (e.g. parsing a PDF) overlaps
+    with slow consumption (e.g. reading aloud). An exception raised by the iterable is re-raised to the consumer.
+
+    Args:
+        iterable (Iterable): Items to produce.
+        maxsize (int, optional): Maximum number of items produced ahead. Defaults to 2.
+
+    Yields:
+        object: The items of the iterable in order.
+    """
+    items = queue.Queue(maxsize=maxsize)
+    done = object()
+
+    def produce():
+        try:
+            for item in iterable:
+                items.put((item, None))
+        except BaseException as e:
+            # Also hand over e.g. SystemExit, otherwise the consumer would wait forever.
+            items.put((done, e))
+            return
+        items.put((done, None))
+
+    # A daemon thread does not keep the process alive when the user interrupts the reading.
+    threading.Thread(target=produce, daemon=True).start()
+    while True:
+        item, error = items.get()
+        if item is done:
+            if error is not None:
+                raise error
+            return
+        yield item
+
+
+def run_in_background(func: Callable, *args, **kwargs) -> Callable:
+    """Call a function in a background thread.
+
+    Args:
+        func (Callable): Function to call.
+        *args: Positional arguments of the function.
+        **kwargs: Keyword arguments of the function.
+
+    Returns:
+        Callable: Waits for the call to finish and returns its result. An exception raised by the function is
+            re-raised.
+    """
+    results = queue.Queue(maxsize=1)
+
+    def call():
+        try:
+            results.put((func(*args, **kwargs), None))
+        except BaseException as e:
+            # Also hand over e.g. SystemExit, otherwise the caller would wait forever.
+            results.put((None, e))
+
+    # A daemon thread does not keep the process alive when the user interrupts the call.
+    threading.Thread(target=call, daemon=True).start()
+
+    def wait():
+        result, error = results.get()
+        if error is not None:
+            raise error
+        return result
+
+    return wait
+
+
 def save_settings(config_path: str, settings: dict):
     """Save the settings to file.
 
+    The settings are written to a temporary file that then replaces the configuration file,
+    so an interrupted save never leaves a truncated configuration behind.
+
     Args:
         config_path (str): Path to the configuration file.
         settings (dict): Dictionary of the settings.
     """
+    tmp_path = f'{config_path}.tmp'
     try:
-        with open(config_path, 'w', encoding="utf-8") as f:
+        with open(tmp_path, 'w', encoding="utf-8") as f:
             json.dump(settings, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
     except Exception as e:
         logger.error('Error saving settings: %s', e)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(tmp_path)
+
+
+def update_settings(settings: dict, args: argparse.Namespace) -> dict:
+    """Override the settings with the command line arguments that are given.
+
+    Args:
+        settings (dict): Settings of one section, updated in place.
+        args (argparse.Namespace): Arguments.
 
+    Returns:
+        dict: The settings that changed.
+    """
+    changes = {prop: value for prop in settings
+               if (value := getattr(args, prop)) is not None and value != settings[prop]}
+    settings.update(changes)
+    return changes
 
-def initialize_configuration(args: configargparse.Namespace) -> tuple:
+
+def initialize_configuration(args: argparse.Namespace) -> tuple:
     """Initialize the configuration.
 
     Args:
-        args (configargparse.Namespace): Arguments.
+        args (argparse.Namespace): Arguments.
 
     Returns:
         tuple: settings, config_path
     """
-    config_dir = user_config_dir('audioarxiv')
-    os.makedirs(config_dir, exist_ok=True)
-    config_file = 'config.json'
-    config_path = os.path.join(config_dir, config_file)
+    config_file = Path(user_config_dir('audioarxiv')) / 'config.json'
+    config_file.parent.mkdir(parents=True, exist_ok=True)
+    config_path = str(config_file)
     # Default settings.
     settings = {
         'audio': {
@@ -72,51 +170,32 @@ def initialize_configuration(args: configargparse.Namespace) -> tuple:
         }
     }
 
-    # Validate the default settings.
-    if os.path.exists(config_path):
-        # Load the settings from the config file.
-        try:
-            with open(config_path, encoding="utf-8") as f:
-                loaded_settings = json.load(f)
-                settings.update(loaded_settings)
-                settings['audio'] = validate_audio_arguments(**settings['audio'])
-                settings['paper'] = validate_paper_arguments(**settings['paper'])
-        except Exception as e:
-            logger.error('Error loading settings: %s. Using defaults.', e)
-    else:
-        logger.info('Saving default settings to %s...', config_path)
-        settings['audio'] = validate_audio_arguments(**settings['audio'])
-        settings['paper'] = validate_paper_arguments(**settings['paper'])
-        save_settings(config_path, settings)
+    # Merge the settings from the config file into the defaults.
+    config_exists = True
+    try:
+        with open(config_path, encoding="utf-8") as f:
+            loaded_settings = json.load(f)
+        audio_settings = validate_audio_arguments(**{**settings['audio'], **loaded_settings.get('audio', {})})
+        paper_settings = validate_paper_arguments(**{**settings['paper'], **loaded_settings.get('paper', {})})
+        settings = {'audio': audio_settings, 'paper': paper_settings}
+    except FileNotFoundError:
+        config_exists = False
+    except Exception as e:
+        logger.error('Error loading settings: %s. Using defaults.', e)
 
-    # Check audio properties
-    audio_properties = list(settings['audio'].keys())
-    audio_settings_changed = False
-    for prop in audio_properties:
-        value = getattr(args, prop)
-        if value is not None:
-            # Compare with the existing setting
-            if value != settings['audio'][prop]:
-                settings['audio'][prop] = value
-                audio_settings_changed = True
-    if audio_settings_changed:
+    # Override with the command line arguments.
+    audio_changes = update_settings(settings['audio'], args)
+    paper_changes = update_settings(settings['paper'], args)
+    if audio_changes:
         settings['audio'] = validate_audio_arguments(**settings['audio'])
-
-    # Check paper properties
-    paper_properties = list(settings['paper'].keys())
-    paper_settings_changed = False
-    for prop in paper_properties:
-        value = getattr(args, prop)
-        if value is not None:
-            # Compare with the existing setting
-            if value != settings['paper'][prop]:
-                settings['paper'][prop] = value
-                paper_settings_changed = True
-    if paper_settings_changed:
+    if paper_changes:
         settings['paper'] = validate_paper_arguments(**settings['paper'])
 
-    # Write the settings to file if there are changes.
-    if audio_settings_changed or paper_settings_changed:
+    # Write the settings to file once if there is none yet or if there are changes.
+    if not config_exists:
+        logger.info('Saving default settings to %s...', config_path)
+        save_settings(config_path, settings)
+    elif audio_changes or paper_changes:
         logger.info('Saving updated settings to %s...', config_path)
         save_settings(config_path=config_path, settings=settings)
     return settings, config_path
@@ -128,7 +207,7 @@ def main():
     signal.signal(signal.SIGINT, handle_exit)
     signal.signal(signal.SIGTERM, handle_exit)
 
-    parser = configargparse.ArgParser()
+    parser = argparse.ArgumentParser()
     parser.add_argument('--id', help='arXiv paper ID.')
     parser.add_argument('--output', type=str, help='Output to audio file if provided.')
     parser.add_argument('--rate', type=float, help='Number of words per minute between 50 and 500.')
@@ -151,11 +230,12 @@ def main():
     # Get the settings
     settings, config_path = initialize_configuration(args)
 
+    # The settings are already validated.
     # The Audio instance.
-    audio = Audio(**settings['audio'])
+    audio = Audio(**settings['audio'], validate_arguments=False)
 
     # Load the paper.
-    paper = Paper(**settings['paper'])
+    paper = Paper(**settings['paper'], validate_arguments=False)
 
     # Search the paper.
     # Print the information
@@ -169,19 +249,21 @@ def main():
         logger.info('%s: %s', key, value)
 
     logger.info('Searching arxiv: %s...', args.id)
-    paper.search_by_arxiv_id(arxiv_id=args.id)
-    # Get the sections
-    sections = paper.sections
+    wait_for_search = run_in_background(paper.search_by_arxiv_id, arxiv_id=args.id)
+    # Initialize the engine while the request is in flight.
+    # The engine stays on this thread since the drivers are bound to the thread that created them.
+    audio.warm_up()
+    wait_for_search()
     if args.output is None:
-        for section in sections:
+        # Parse the next sections in the background while reading.
+        # read_article returns once the engine has finished speaking and adds the pause after each sentence.
+        for section in prefetch(paper.iter_sections()):
             audio.read_article(section['header'])
-            time.sleep(1)
             for content in section['content']:
                 audio.read_article(content)
-                time.sleep(1)
     else:
         article = []
-        for section in sections:
+        for section in paper.sections:
             if section['header'] is not None:
                 article.append(section['header'])
             if section['content'] is not None:
@@ -62,26 +62,81 @@ def test_audio_initialization(audio_instance):
     assert audio_instance.pause_seconds == 0.5  # Check if pause_seconds is set correctly
 
 
+class FakeEngine(MagicMock):
+    """A mock engine that records what is spoken.
+
+    Like pyttsx3, runAndWait() queues an end-of-loop command after the queued utterances,
+    and ending the loop clears whatever is still queued.
+    """
+
+    END_LOOP = object()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.queue = []
+        self.spoken = []
+
+    def say(self, text, name=None):
+        self.queue.append(text)
+
+    def runAndWait(self):
+        self.queue.append(self.END_LOOP)
+        while self.queue:
+            text = self.queue.pop(0)
+            if text is self.END_LOOP:
+                self.queue = []
+                return
+            self.spoken.append(text)
+
+
 @patch('audioarxiv.audio.base.time.sleep')  # prevent actual sleeping
 @patch('audioarxiv.audio.base.get_sentences')  # control sentence splitting
 @patch('audioarxiv.audio.base.pyttsx3.init')  # control TTS engine
 def test_read_article(mock_init, mock_get_sentences, mock_sleep):
-    # Create a mock engine with say() and runAndWait()
-    mock_engine = MagicMock()
+    # Create a fake engine that records what is spoken
+    mock_engine = FakeEngine()
     mock_init.return_value = mock_engine
 
     # Mock get_sentences to return predictable output
-    mock_get_sentences.return_value = ['Sentence 1', 'Sentence 2']
+    mock_get_sentences.return_value = ['Sentence 1', 'Sentence 2', 'Sentence 3']
 
     # Create Audio instance and run test
     audio = Audio()
+    with patch.object(mock_engine, 'runAndWait', wraps=mock_engine.runAndWait) as mock_run:
+        audio.read_article("Some article.")
+
+    # All sentences are spoken in order, one run of the engine each
+    assert mock_engine.spoken == ['Sentence 1', 'Sentence 2', 'Sentence 3']
+    assert mock_run.call_count == 3
+    assert mock_sleep.call_count == 3
+
+
+@patch('audioarxiv.audio.base.time.sleep')
+@patch('audioarxiv.audio.base.pyttsx3.init')
+def test_read_article_reads_every_sentence_of_consecutive_articles(mock_init, mock_sleep):  # noqa: ARG001 # pylint: disable=unused-argument
+    mock_engine = FakeEngine()
+    mock_init.return_value = mock_engine
+
+    audio = Audio()
+    audio.read_article("A one. A two. A three.")
+    audio.read_article("B one. B two. B three.")
+
+    assert mock_engine.spoken == ['A one.', 'A two.', 'A three.', 'B one.', 'B two.', 'B three.']
+
+
+@patch('audioarxiv.audio.base.time.sleep')
+@patch('audioarxiv.audio.base.get_sentences')
+@patch('audioarxiv.audio.base.pyttsx3.init')
+def test_read_article_without_pause(mock_init, mock_get_sentences, mock_sleep):
+    mock_engine = FakeEngine()
+    mock_init.return_value = mock_engine
+    mock_get_sentences.return_value = ['Sentence 1', 'Sentence 2']
+
+    audio = Audio(pause_seconds=0)
     audio.read_article("Some article.")
 
-    # Verify say() was called with the expected sentence
-    mock_engine.say.assert_any_call('Sentence 1')
-    mock_engine.say.assert_any_call('Sentence 2')
-    assert mock_engine.runAndWait.call_count == 2
-    assert mock_sleep.call_count == 2
+    assert mock_engine.spoken == ['Sentence 1', 'Sentence 2']
+    mock_sleep.assert_not_called()
 
 
 def test_save_article(audio_instance, monkeypatch):
@@ -166,7 +221,8 @@ def test_audio_sets_voice_property():
         mock_engine.getProperty.return_value = [mock_voice]
         mock_init.return_value = mock_engine
 
-        audio = Audio(voice="mock_voice_id")  # noqa: F841
+        audio = Audio(voice="mock_voice_id")
+        assert audio.engine is mock_engine
         # Ensure setProperty was called with the correct voice ID
         mock_engine.setProperty.assert_any_call("voice", "mock_voice_id")
 
@@ -193,6 +249,7 @@ def test_audio_stop(mock_init):
 
     # Create the Audio instance, which should use the mocked engine
     audio = Audio()
+    assert audio.engine is mock_engine
 
     # Call the stop method
     audio.stop()
@@ -216,11 +273,12 @@ def test_validate_arguments_enabled(mock_init):
         }
 
         # Act
-        audio = Audio(rate=150,  # noqa: F841 # pylint: disable=unused-variable
+        audio = Audio(rate=150,
                       volume=0.8,
                       voice="voice_id",
                       pause_seconds=0.2,
                       validate_arguments=True)
+        assert audio.engine is mock_engine
 
         # Assert
         mock_validate.assert_called_once()
@@ -235,11 +293,12 @@ def test_validate_arguments_disabled(mock_init):
     mock_init.return_value = mock_engine
     # Should not call `validate_audio_arguments`
     with patch("audioarxiv.audio.base.validate_audio_arguments") as mock_validate:
-        audio = Audio(rate=150,  # noqa: F841 # pylint: disable=unused-variable
+        audio = Audio(rate=150,
                       volume=0.8,
                       voice="voice_id",
                       pause_seconds=0.2,
                       validate_arguments=False)
+        assert audio.engine is mock_engine
 
         mock_validate.assert_not_called()
         mock_engine.setProperty.assert_any_call('rate', 150)
@@ -252,7 +311,8 @@ def test_validate_arguments_disabled(mock_init):
 def test_rate_handling(mock_init, rate):
     mock_engine = MagicMock()
     mock_init.return_value = mock_engine
-    audio = Audio(rate=rate, volume=0.8, validate_arguments=False)  # noqa: F841 # pylint: disable=unused-variable
+    audio = Audio(rate=rate, volume=0.8, validate_arguments=False)
+    assert audio.engine is mock_engine
     if rate is not None:
         mock_engine.setProperty.assert_any_call('rate', rate)
     else:
@@ -265,9 +325,49 @@ def test_rate_handling(mock_init, rate):
 def test_volume_handling(mock_init, volume):
     mock_engine = MagicMock()
     mock_init.return_value = mock_engine
-    audio = Audio(rate=140, volume=volume, validate_arguments=False)  # noqa: F841 # pylint: disable=unused-variable
+    audio = Audio(rate=140, volume=volume, validate_arguments=False)
+    assert audio.engine is mock_engine
     if volume is not None:
         mock_engine.setProperty.assert_any_call('volume', volume)
     else:
         for call in mock_engine.setProperty.call_args_list:
             assert call[0][0] != 'volume'
+
+
+def test_clean_text(audio_instance):
+    text = "  First line,\nsecond\t line.\r\n\n Third   line.  "
+    assert audio_instance.clean_text(text) == "First line, second line. Third line."
+
+
+@patch("audioarxiv.audio.base.pyttsx3.init")
+def test_engine_is_initialized_lazily(mock_init):
+    mock_engine = MagicMock()
+    mock_init.return_value = mock_engine
+
+    audio = Audio(rate=150, volume=0.8)
+    mock_init.assert_not_called()
+
+    # Stopping before anything is spoken does not start the engine
+    audio.stop()
+    mock_init.assert_not_called()
+
+    assert audio.engine is mock_engine
+    assert audio.engine is mock_engine
+    mock_init.assert_called_once()
+    mock_engine.setProperty.assert_any_call('rate', 150)
+    mock_engine.setProperty.assert_any_call('volume', 0.8)
+
+
+@patch("audioarxiv.audio.base.pyttsx3.init")
+def test_warm_up(mock_init):
+    mock_engine = MagicMock()
+    mock_init.return_value = mock_engine
+
+    audio = Audio(rate=150, volume=0.8, validate_arguments=False)
+    mock_init.assert_not_called()
+
+    assert audio.warm_up() is mock_engine
+    assert audio.warm_up() is mock_engine
+    mock_init.assert_called_once()
+    mock_engine.setProperty.assert_any_call('rate', 150)
+
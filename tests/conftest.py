@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("audioarxiv.resources.paper.user_cache_dir", lambda appname: str(tmp_path))
+    return tmp_path / "pdf"
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
+import pytest
+
 from audioarxiv.preprocess import get_sentences
+from audioarxiv.preprocess.article import _ensure_punkt, _get_sentences_cached
 
 
 def test_get_sentences_basic():
@@ -44,3 +49,38 @@ def test_get_sentences_multiple_spaces():
     text = "This is a sentence.     This is another."
     sentences = get_sentences(text)
     assert sentences == ["This is a sentence.", "This is another."]
+
+
+def test_get_sentences_is_cached():
+    _get_sentences_cached.cache_clear()
+    text = "A cached sentence. Another one."
+    with patch("audioarxiv.preprocess.article.sent_tokenize",
+               return_value=["A cached sentence.", "Another one."]) as mock_sent_tokenize:
+        first = get_sentences(text)
+        first.append("Modified by the caller.")
+        second = get_sentences(text)
+    mock_sent_tokenize.assert_called_once_with(text)
+    assert second == ["A cached sentence.", "Another one."]
+
+
+@pytest.mark.parametrize("installed", [True, False])
+def test_tokenizer_downloaded_only_if_missing(installed):
+    side_effect = None if installed else LookupError("punkt_tab")
+    with patch("nltk.data.find", side_effect=side_effect) as mock_find, patch("nltk.download") as mock_download:
+        _ensure_punkt()
+    mock_find.assert_called_once_with('tokenizers/punkt_tab')
+    if installed:
+        mock_download.assert_not_called()
+    else:
+        mock_download.assert_called_once_with('punkt_tab')
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1 Introduction", ["1 Introduction"]),
+    ("Related work:  ", ["Related work:"]),
+    ("   ", []),
+])
+def test_get_sentences_without_sentence_end_skips_tokenizer(text, expected):
+    with patch("audioarxiv.preprocess.article.sent_tokenize") as mock_sent_tokenize:
+        assert get_sentences(text) == expected
+    mock_sent_tokenize.assert_not_called()
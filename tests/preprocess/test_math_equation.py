@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
+from sympy.parsing.sympy_parser import parse_expr
 
 from audioarxiv.preprocess import process_math_equations
+from audioarxiv.preprocess.math_equation import _readable
 
 
 def test_simple_inline_equation():
@@ -54,3 +58,12 @@ def test_nested_dollars():
     output = process_math_equations(text)
     # Should ideally not break
     assert "$" not in output or "Math:" in output or "Equation:" in output
+
+
+def test_repeated_equation_is_parsed_once():
+    _readable.cache_clear()
+    text = "Let $q+1$ be given. Then $q+1$ is used again."
+    with patch("sympy.parsing.sympy_parser.parse_expr", wraps=parse_expr) as mock_parse_expr:
+        output = process_math_equations(text)
+    assert output.count("Add(Symbol('q'), Integer(1))") == 2
+    mock_parse_expr.assert_called_once_with("q+1")
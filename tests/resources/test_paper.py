@@ -1,13 +1,25 @@
 from __future__ import annotations
 
 import logging
+import os
+import time
 from datetime import datetime
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import fitz
 import pytest
 
 from audioarxiv.resources.paper import (  # Replace with actual module name
-    Paper, validate_paper_arguments)
+    Paper, extract_page_blocks, extract_page_texts, is_section_header,
+    validate_paper_arguments)
+
+
+def _write_pdf(dirpath, filename):
+    # Stand in for arxiv's download, which writes the PDF to dirpath/filename.
+    path = Path(dirpath) / filename
+    path.write_bytes(b"%PDF")
+    return str(path)
 
 
 @pytest.fixture
@@ -45,6 +57,22 @@ def test_validate_paper_arguments():
     }
 
 
+def test_validate_paper_arguments_out_of_range(caplog):
+    logger = logging.getLogger('audioarxiv')
+    logger.propagate = True
+
+    with caplog.at_level(logging.ERROR, logger='audioarxiv'):
+        args = validate_paper_arguments(page_size=5000, delay_seconds=-1.0, num_retries=-2)
+    assert args == {
+        'page_size': 2000,
+        'delay_seconds': 0.0,
+        'num_retries': 0
+    }
+    assert 'page_size = 5000 must be between 1 and 2000' in caplog.text
+    assert 'delay_seconds = -1.0 must be non-negative' in caplog.text
+    assert 'num_retries = -2 must be non-negative' in caplog.text
+
+
 @patch("audioarxiv.resources.paper.arxiv.Client")
 def test_search_by_arxiv_id_and_properties(mock_client_class, mock_paper_object):
     mock_client = MagicMock()
@@ -143,6 +171,7 @@ def test_sections_with_valid_pdf(mock_client_class, mock_paper_object):
     mock_client_class.return_value = mock_client
 
     # Setup: Create Paper instance with no paper assigned
+    mock_paper_object.download_pdf.side_effect = _write_pdf
     paper = Paper(validate_arguments=False)
     paper.search_by_arxiv_id('arxiv_id')
 
@@ -151,7 +180,7 @@ def test_sections_with_valid_pdf(mock_client_class, mock_paper_object):
         mock_page = MagicMock()
         mock_page.get_text.return_value = [[None, None, None, None, "SECTION HEADER\n"],
                                            [None, None, None, None, "Section Content"]]
-        mock_fitz_open.return_value = [mock_page]
+        mock_fitz_open.return_value.__enter__.return_value = [mock_page]
 
         # Call the `sections` property
         sections = paper.sections
@@ -196,11 +225,11 @@ def test_sections_extraction_logic(download_pdf_mock, fitz_open_mock):
     ]
 
     mock_doc = [mock_page]
-    fitz_open_mock.return_value = mock_doc
+    fitz_open_mock.return_value.__enter__.return_value = mock_doc
 
     paper = Paper()
     paper.paper = MagicMock()
-    download_pdf_mock.return_value = "mock_path"
+    download_pdf_mock.side_effect = _write_pdf
 
     sections = paper.sections
 
@@ -209,6 +238,7 @@ def test_sections_extraction_logic(download_pdf_mock, fitz_open_mock):
     assert sections[0]["content"] == ["This is the first paragraph."]
     assert sections[1]["header"] == "2 Related Work"
     assert sections[1]["content"] == ["Some related work goes here."]
+    mock_page.get_text.assert_called_once_with("blocks", flags=fitz.TEXTFLAGS_BLOCKS | fitz.TEXT_DEHYPHENATE)
 
 
 @patch("fitz.open")
@@ -221,11 +251,11 @@ def test_sections_only_appends_nonempty_sections(download_pdf_mock, fitz_open_mo
     ]
 
     mock_doc = [mock_page]
-    fitz_open_mock.return_value = mock_doc
+    fitz_open_mock.return_value.__enter__.return_value = mock_doc
 
     paper = Paper()
     paper.paper = MagicMock()
-    download_pdf_mock.return_value = "mock_path"
+    download_pdf_mock.side_effect = _write_pdf
 
     sections = paper.sections
 
@@ -245,3 +275,143 @@ def test_sections_empty_when_no_paper(download_pdf_mock, fitz_open_mock):
 
     # Triggers early return due to missing paper
     assert sections == []
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("INTRODUCTION", True),
+    ("2.1 Methods", True),
+    ("Acknowledgements:", True),
+    ("This is a paragraph.", False),
+    ("", False),
+])
+def test_is_section_header(text, expected):
+    assert is_section_header(text) is expected
+
+
+def test_extract_page_blocks(tmp_path):
+    filename = str(tmp_path / "paper.pdf")
+    with fitz.open() as doc:
+        for i in range(3):
+            page = doc.new_page()
+            page.insert_text((72, 72), f"{i + 1} Section")
+        doc.save(filename)
+
+    with fitz.open(filename) as doc:
+        blocks = [extract_page_blocks(page) for page in doc]
+
+    assert blocks == [(["1 Section"], [True]), (["2 Section"], [True]), (["3 Section"], [True])]
+
+
+@patch("fitz.open")
+@patch.object(Paper, "download_pdf")
+def test_sections_uses_cached_pdf(download_pdf_mock, fitz_open_mock, cache_dir):
+    mock_page = MagicMock()
+    mock_page.get_text.return_value = [(0, 0, 100, 100, "1 Introduction", 0, 0)]
+    fitz_open_mock.return_value.__enter__.return_value = [mock_page]
+    download_pdf_mock.side_effect = _write_pdf
+
+    paper = Paper()
+    paper.paper = MagicMock()
+    paper.paper.get_short_id.return_value = "quant-ph/0201082v1"
+
+    # The first call downloads the PDF to a temporary file that is moved into the cache
+    assert paper.sections == [{"header": "1 Introduction", "content": []}]
+    download_pdf_mock.assert_called_once_with(dirpath=str(cache_dir),
+                                              filename=f"quant-ph_0201082v1.pdf.{os.getpid()}.tmp")
+    fitz_open_mock.assert_called_once_with(str(cache_dir / "quant-ph_0201082v1.pdf"))
+    assert [path.name for path in cache_dir.iterdir()] == ["quant-ph_0201082v1.pdf"]
+
+    # Another instance of the same paper reads the cached PDF
+    other = Paper()
+    other.paper = paper.paper
+    assert other.sections == [{"header": "1 Introduction", "content": []}]
+    download_pdf_mock.assert_called_once()
+
+
+@patch.object(Paper, "download_pdf")
+def test_sections_removes_partial_download(download_pdf_mock, cache_dir):
+    def failing_download(dirpath, filename):
+        (cache_dir / filename).write_bytes(b"%PDF-partial")
+        raise ConnectionError("connection lost")
+
+    download_pdf_mock.side_effect = failing_download
+
+    paper = Paper()
+    paper.paper = MagicMock()
+    paper.paper.get_short_id.return_value = "2107.05580v1"
+
+    with pytest.raises(ConnectionError):
+        _ = paper.sections
+    assert not list(cache_dir.iterdir())
+
+
+@patch.object(Paper, "download_pdf")
+def test_sections_removes_stale_downloads(download_pdf_mock, cache_dir):
+    cache_dir.mkdir(parents=True)
+    stale = cache_dir / "2107.05580v1.pdf.123.tmp"
+    stale.write_bytes(b"%PDF-partial")
+    old = time.time() - 2 * 3600
+    os.utime(stale, (old, old))
+    # May still be written by another process
+    running = cache_dir / "2107.05580v1.pdf.456.tmp"
+    running.write_bytes(b"%PDF-partial")
+    download_pdf_mock.side_effect = _write_pdf
+
+    paper = Paper()
+    paper.paper = MagicMock()
+    paper.paper.get_short_id.return_value = "2107.05580v1"
+    with patch("fitz.open"):
+        _ = paper.sections
+
+    assert sorted(path.name for path in cache_dir.iterdir()) == ["2107.05580v1.pdf", running.name]
+
+
+@patch("fitz.open")
+@patch.object(Paper, "download_pdf")
+def test_iter_sections_closes_pdf(download_pdf_mock, fitz_open_mock):
+    mock_page = MagicMock()
+    mock_page.get_text.return_value = [(0, 0, 100, 100, "1 Introduction", 0, 0)]
+    fitz_open_mock.return_value.__enter__.return_value = [mock_page]
+    download_pdf_mock.side_effect = _write_pdf
+
+    paper = Paper()
+    paper.paper = MagicMock()
+    assert paper.sections == [{"header": "1 Introduction", "content": []}]
+    fitz_open_mock.return_value.__exit__.assert_called_once()
+
+
+def test_extract_page_texts_normalizes_characters():
+    mock_page = MagicMock()
+    mock_page.get_text.return_value = [(0, 0, 100, 100, "\x0cA well-known hy\xadphen\r\nated word. \n", 0, 0)]
+    assert extract_page_texts(mock_page) == ["A well-known hyphen \nated word."]
+
+
+@patch("fitz.open")
+@patch.object(Paper, "download_pdf")
+def test_iter_sections_caches_only_complete_parse(download_pdf_mock, fitz_open_mock):
+    mock_page = MagicMock()
+    mock_page.get_text.return_value = [
+        (0, 0, 100, 100, "1 Introduction", 0, 0),
+        (0, 0, 100, 100, "First paragraph.", 0, 0),
+        (0, 0, 100, 100, "2 Methods", 0, 0),
+        (0, 0, 100, 100, "Second paragraph.", 0, 0),
+    ]
+    fitz_open_mock.return_value.__enter__.return_value = [mock_page]
+    download_pdf_mock.side_effect = _write_pdf
+
+    paper = Paper()
+    paper.paper = MagicMock()
+
+    # Stopping early does not cache a partial list of sections
+    first = next(paper.iter_sections())
+    assert first == {"header": "1 Introduction", "content": ["First paragraph."]}
+    assert paper._sections == []  # pylint: disable=protected-access
+
+    sections = list(paper.iter_sections())
+    assert sections == [{"header": "1 Introduction", "content": ["First paragraph."]},
+                        {"header": "2 Methods", "content": ["Second paragraph."]}]
+    assert paper.sections == sections
+
+    # Once cached, the PDF is not parsed again
+    assert list(paper.iter_sections()) == sections
+    assert fitz_open_mock.call_count == 2
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import audioarxiv
 from audioarxiv import (env_package_list, get_version_information,
                         loaded_modules_dict, setup_logger)
 
@@ -35,6 +39,25 @@ def test_setup_logger_creates_handlers():
         assert "audioarxiv version" in content.lower()
 
 
+def test_setup_logger_is_idempotent_with_file_handler():
+    logger = logging.getLogger("test_logger_file_first")
+    logger.handlers = []
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_handler = logging.FileHandler(Path(tmpdir) / "existing.log")
+        logger.addHandler(file_handler)
+
+        # A file handler alone must not count as a console handler
+        setup_logger(logger)
+        setup_logger(logger, log_level="DEBUG")
+
+        stream_handlers = [h for h in logger.handlers if not isinstance(h, logging.FileHandler)]
+        assert len(stream_handlers) == 1
+        assert len(logger.handlers) == 2
+        assert all(h.level == logging.DEBUG for h in logger.handlers)
+        file_handler.close()
+
+
 def test_loaded_modules_dict_structure():
     modules = loaded_modules_dict()
     assert isinstance(modules, dict)
@@ -57,8 +80,82 @@ def test_env_package_list_conda(mock_sub_proc):
         assert all("name" in pkg and "version" in pkg for pkg in result)
 
 
+@patch("importlib.metadata.distributions", return_value=[])
+@patch("audioarxiv.subprocess.check_output")
+def test_env_package_list_conda_meta(mock_sub_proc, mock_distributions, tmp_path):  # pylint: disable=unused-argument
+    conda_meta = tmp_path / "conda-meta"
+    conda_meta.mkdir()
+    (conda_meta / "history").write_text("==> 2024-01-01 <==\n")
+    (conda_meta / "numpy-1.24.0-py311_0.json").write_text(json.dumps(
+        {"name": "numpy", "version": "1.24.0", "build": "py311_0", "build_number": 0,
+         "channel": "https://conda.anaconda.org/conda-forge/linux-64"}))
+    (conda_meta / "python-3.11.0-h1_0.json").write_text(json.dumps(
+        {"name": "python", "version": "3.11.0", "build": "h1_0", "build_number": 0}))
+
+    with patch("audioarxiv.sys.prefix", str(tmp_path)):
+        result = env_package_list()
+
+    mock_sub_proc.assert_not_called()
+    assert result == [{"name": "numpy", "version": "1.24.0"}, {"name": "python", "version": "3.11.0"}]
+
+
+@patch("importlib.metadata.distributions")
+@patch("audioarxiv.subprocess.check_output")
+def test_env_package_list_conda_meta_with_pip_packages(mock_sub_proc, mock_distributions, tmp_path):
+    conda_meta = tmp_path / "conda-meta"
+    conda_meta.mkdir()
+    (conda_meta / "typing-extensions-4.9.0-py_0.json").write_text(json.dumps(
+        {"name": "typing-extensions", "version": "4.9.0", "build": "py_0", "build_number": 0}))
+    mock_distributions.return_value = [
+        MagicMock(metadata={"Name": "typing_extensions"}, version="4.9.0"),  # Installed by conda
+        MagicMock(metadata={"Name": "arxiv"}, version="2.1.0"),  # Installed by pip
+    ]
+
+    with patch("audioarxiv.sys.prefix", str(tmp_path)):
+        result = env_package_list()
+
+    mock_sub_proc.assert_not_called()
+    assert result == [{"name": "typing-extensions", "version": "4.9.0"}, {"name": "arxiv", "version": "2.1.0"}]
+
+
 @patch("audioarxiv.subprocess.check_output")
-def test_env_package_list_pip(mock_sub_proc):
+def test_env_package_list_conda_meta_invalid(mock_sub_proc, tmp_path):
+    conda_meta = tmp_path / "conda-meta"
+    conda_meta.mkdir()
+    (conda_meta / "broken-1.0-0.json").write_text("{")
+    mock_sub_proc.return_value = json.dumps([{"name": "numpy", "version": "1.24.0"}]).encode("utf-8")
+
+    with patch("audioarxiv.sys.prefix", str(tmp_path)):
+        result = env_package_list()
+
+    mock_sub_proc.assert_called_once()
+    assert result == [{"name": "numpy", "version": "1.24.0"}]
+
+
+def _distribution(name, version):
+    return MagicMock(metadata={"Name": name}, version=version)
+
+
+@patch("importlib.metadata.distributions")
+@patch("audioarxiv.subprocess.check_output")
+def test_env_package_list_pip(mock_sub_proc, mock_distributions):
+    mock_distributions.return_value = [
+        _distribution("requests", "2.31.0"),
+        _distribution("Flask", "3.0.0"),
+        _distribution("requests", "2.0.0"),  # Shadowed by the first one on the path
+        MagicMock(metadata={}, version="1.0"),  # Broken metadata without a name
+    ]
+
+    with patch("pathlib.Path.is_dir", return_value=False):  # Simulate no conda-meta
+        result = env_package_list()
+
+    mock_sub_proc.assert_not_called()
+    assert result == [{"name": "Flask", "version": "3.0.0"}, {"name": "requests", "version": "2.31.0"}]
+
+
+@patch("importlib.metadata.distributions", return_value=[])
+@patch("audioarxiv.subprocess.check_output")
+def test_env_package_list_pip_fallback(mock_sub_proc, mock_distributions):  # pylint: disable=unused-argument
     mock_pkgs = [
         {"name": "requests", "version": "2.31.0"},
         {"name": "flask", "version": "3.0.0"},
@@ -71,16 +168,22 @@ def test_env_package_list_pip(mock_sub_proc):
         assert all("name" in pkg and "version" in pkg for pkg in result)
 
 
-@patch("audioarxiv.subprocess.check_output")
-def test_env_package_list_as_dataframe(mock_sub_proc):
-    mock_pkgs = [
-        {"name": "torch", "version": "2.1.0"},
-        {"name": "scipy", "version": "1.11.0"},
+@patch("importlib.metadata.distributions")
+def test_env_package_list_as_dataframe(mock_distributions):
+    mock_distributions.return_value = [
+        _distribution("torch", "2.1.0"),
+        _distribution("scipy", "1.11.0"),
     ]
-    mock_sub_proc.return_value = json.dumps(mock_pkgs).encode("utf-8")
 
     with patch("pathlib.Path.is_dir", return_value=False):
         df = env_package_list(as_dataframe=True)
         assert df.shape[0] == 2  # type: ignore[attr-defined]
         assert "name" in df.columns  # type: ignore[attr-defined]
         assert "version" in df.columns  # type: ignore[attr-defined]
+
+
+def test_import_does_not_load_pandas_or_sympy():
+    code = "import sys, audioarxiv; sys.exit('pandas' in sys.modules or 'sympy' in sys.modules)"
+    src_dir = str(Path(audioarxiv.__file__).parents[1])
+    result = subprocess.run([sys.executable, "-c", code], env={**os.environ, "PYTHONPATH": src_dir}, check=False)
+    assert result.returncode == 0
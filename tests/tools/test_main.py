@@ -5,15 +5,17 @@ import logging
 import os
 import signal
 import tempfile
+import threading
 from datetime import datetime
-from unittest import mock
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 import pyttsx3
 
 from audioarxiv.tools.main import (handle_exit, initialize_configuration, main,
-                                   save_settings)
+                                   prefetch, run_in_background, save_settings,
+                                   update_settings)
 
 
 @pytest.fixture
@@ -44,7 +46,7 @@ def mock_paper_object():
 @pytest.mark.integration
 @patch("audioarxiv.tools.main.Audio")
 @patch("audioarxiv.tools.main.Paper")
-@patch("audioarxiv.tools.main.configargparse.ArgParser.parse_args")
+@patch("audioarxiv.tools.main.argparse.ArgumentParser.parse_args")
 def test_main_with_id_and_output(mock_parse_args, mock_Paper, mock_Audio):
     mock_args = MagicMock()
     mock_args.id = "1234.5678"
@@ -77,7 +79,7 @@ def test_main_with_id_and_output(mock_parse_args, mock_Paper, mock_Audio):
 
 @pytest.mark.integration
 @patch("audioarxiv.tools.main.Audio")
-@patch("audioarxiv.tools.main.configargparse.ArgParser.parse_args")
+@patch("audioarxiv.tools.main.argparse.ArgumentParser.parse_args")
 def test_main_list_voices(mock_parse_args, mock_Audio):
     mock_args = MagicMock()
     mock_args.list_voices = True
@@ -111,13 +113,28 @@ def test_initialize_configuration_defaults(mock_validate_paper, mock_validate_au
 
 
 @pytest.mark.integration
-@patch("builtins.open", new_callable=mock.mock_open)
-def test_save_settings(mock_open_func):
+def test_save_settings(tmp_path):
     settings = {"audio": {"rate": 150}, "paper": {"page_size": 50}}
-    save_settings("config.json", settings)
-    mock_open_func.assert_called_once_with("config.json", 'w', encoding='utf-8')
-    handle = mock_open_func()
-    handle.write.assert_called()
+    config_path = tmp_path / "config.json"
+    config_path.write_text("old", encoding="utf-8")
+    save_settings(str(config_path), settings)
+    assert json.loads(config_path.read_text(encoding="utf-8")) == settings
+    assert list(tmp_path.iterdir()) == [config_path]
+
+
+def test_save_settings_keeps_old_file_on_error(tmp_path, caplog):
+    config_path = tmp_path / "config.json"
+    config_path.write_text('{"audio": {}}', encoding="utf-8")
+
+    logger = logging.getLogger('audioarxiv')
+    logger.propagate = True
+
+    with caplog.at_level(logging.ERROR, logger='audioarxiv'):
+        save_settings(str(config_path), {"audio": {"rate": object()}})
+
+    assert 'Error saving settings' in caplog.text
+    assert config_path.read_text(encoding="utf-8") == '{"audio": {}}'
+    assert list(tmp_path.iterdir()) == [config_path]
 
 
 @pytest.mark.integration
@@ -155,26 +172,24 @@ def test_save_settings_throws_exception(mock_open, caplog):
         save_settings(config_path, settings)
 
         # Assert that the open function was called (even though it will raise an exception)
-        mock_open.assert_called_once_with(config_path, 'w', encoding="utf-8")
+        mock_open.assert_called_once_with(f'{config_path}.tmp', 'w', encoding="utf-8")
 
         assert 'Error saving settings: Mocked IOError during file open' in caplog.text
 
 
 @patch('audioarxiv.tools.main.user_config_dir', return_value='.')  # Mock user_config_dir
-@patch('os.path.exists')
 @patch('builtins.open', new_callable=MagicMock)  # Mock the open function to read the file
 @patch('json.load')  # Mock json.load to simulate loading settings
 @patch('audioarxiv.audio.base.validate_audio_arguments')  # Mock the validate_audio_arguments function
 @patch('audioarxiv.resources.paper.validate_paper_arguments')  # Mock the validate_paper_arguments function
 @patch("audioarxiv.resources.paper.arxiv.Client")
-@patch("configargparse.ArgParser.parse_args")
+@patch("argparse.ArgumentParser.parse_args")
 def test_load_settings(mock_parse_args,
                        mock_client_class,
                        mock_validate_paper,
                        mock_validate_audio,
                        mock_json_load,
                        mock_open,
-                       mock_exists,
                        mock_user_config_dir,
                        mock_pyttsx3_init,
                        mock_paper_object,
@@ -199,7 +214,7 @@ def test_load_settings(mock_parse_args,
     mock_client.results.return_value = iter([mock_paper_object])
     mock_client_class.return_value = mock_client
 
-    mock_paper_object.download_pdf.return_value = "path/to/pdf"
+    mock_paper_object.download_pdf.side_effect = lambda dirpath, filename: Path(dirpath, filename).write_bytes(b"%PDF")
 
     # Set up the logger
     logger = logging.getLogger('audioarxiv')
@@ -208,8 +223,7 @@ def test_load_settings(mock_parse_args,
 
     # Sample settings to be loaded
     config_dir = mock_user_config_dir('audioarxiv')  # Assuming this function is defined correctly
-    config_file = 'config.json'
-    config_path = os.path.join(config_dir, config_file)
+    config_path = str(Path(config_dir) / 'config.json')
     settings_from_file = {
         'audio': {
             'rate': 150,
@@ -234,38 +248,33 @@ def test_load_settings(mock_parse_args,
     mock_validate_audio.return_value = settings_from_file['audio']
     mock_validate_paper.return_value = settings_from_file['paper']
 
-    # Mock file existence
-    mock_exists.return_value = True
-
     with caplog.at_level(logging.ERROR, logger='audioarxiv'):
         # Mock the `download_pdf` and `fitz.open` methods
         with patch('fitz.open') as mock_fitz_open:
             mock_page = MagicMock()
             mock_page.get_text.return_value = [[None, None, None, None, "SECTION HEADER\n"],
                                                [None, None, None, None, "Section Content"]]
-            mock_fitz_open.return_value = [mock_page]
+            mock_fitz_open.return_value.__enter__.return_value = [mock_page]
             main()
 
-    # Verify config_path was checked
-    mock_exists.assert_any_call(config_path)
+    # Verify config_path was read
+    mock_open.assert_any_call(config_path, encoding="utf-8")
     mock_json_load.assert_called_once_with(mock_file)
 
 
 @patch('audioarxiv.tools.main.user_config_dir', return_value='.')  # Mock user_config_dir
-@patch('os.path.exists')
 @patch('builtins.open', new_callable=MagicMock)  # Mock the open function to read the file
 @patch('json.load')  # Mock json.load to simulate loading settings
 @patch('audioarxiv.audio.base.validate_audio_arguments')  # Mock the validate_audio_arguments function
 @patch('audioarxiv.resources.paper.validate_paper_arguments')  # Mock the validate_paper_arguments function
 @patch("audioarxiv.resources.paper.arxiv.Client")
-@patch("configargparse.ArgParser.parse_args")
+@patch("argparse.ArgumentParser.parse_args")
 def test_load_settings_error(mock_parse_args,
                              mock_client_class,
                              mock_validate_paper,
                              mock_validate_audio,
                              mock_json_load,
                              mock_open,
-                             mock_exists,
                              mock_user_config_dir,
                              mock_pyttsx3_init,
                              mock_paper_object,
@@ -290,7 +299,7 @@ def test_load_settings_error(mock_parse_args,
     mock_client.results.return_value = iter([mock_paper_object])
     mock_client_class.return_value = mock_client
 
-    mock_paper_object.download_pdf.return_value = "path/to/pdf"
+    mock_paper_object.download_pdf.side_effect = lambda dirpath, filename: Path(dirpath, filename).write_bytes(b"%PDF")
 
     # Set up the logger
     logger = logging.getLogger('audioarxiv')
@@ -299,8 +308,7 @@ def test_load_settings_error(mock_parse_args,
 
     # Sample settings to be loaded
     config_dir = mock_user_config_dir('audioarxiv')  # Assuming this function is defined correctly
-    config_file = 'config.json'
-    config_path = os.path.join(config_dir, config_file)
+    config_path = str(Path(config_dir) / 'config.json')
 
     settings_from_file = {
         'audio': {
@@ -321,22 +329,22 @@ def test_load_settings_error(mock_parse_args,
     mock_validate_paper.return_value = settings_from_file['paper']
 
     # Set up the mock to simulate file reading failure (File not found error)
-    mock_exists.return_value = False  # Simulate that the file doesn't exist
+    mock_open.side_effect = FileNotFoundError  # Simulate that the file doesn't exist
     with caplog.at_level(logging.INFO, logger='audioarxiv'):
         with patch('fitz.open') as mock_fitz_open:
             mock_page = MagicMock()
             mock_page.get_text.return_value = [[None, None, None, None, "SECTION HEADER\n"],
                                                [None, None, None, None, "Section Content"]]
-            mock_fitz_open.return_value = [mock_page]
+            mock_fitz_open.return_value.__enter__.return_value = [mock_page]
             main()
 
-    # Ensure the file existence check was called and failed
-    mock_exists.assert_any_call(config_path)
-    # Check for the error in logs
-    assert 'Saving default settings to ./config.json...' in caplog.text
+    # Ensure the config file was tried and the defaults were saved
+    mock_open.assert_any_call(config_path, encoding="utf-8")
+    mock_json_load.assert_not_called()
+    assert f'Saving default settings to {config_path}...' in caplog.text
 
     # Now simulate an invalid JSON error
-    mock_exists.return_value = True
+    mock_open.side_effect = None
     mock_file = MagicMock()
     mock_file.read.return_value = b'mocked file content'
     mock_open.return_value.__enter__.return_value = mock_file
@@ -349,10 +357,157 @@ def test_load_settings_error(mock_parse_args,
             mock_page = MagicMock()
             mock_page.get_text.return_value = [[None, None, None, None, "SECTION HEADER\n"],
                                                [None, None, None, None, "Section Content"]]
-            mock_fitz_open.return_value = [mock_page]
+            mock_fitz_open.return_value.__enter__.return_value = [mock_page]
             main()
 
     # Ensure json.load was called
     mock_json_load.assert_called_once_with(mock_file)
     # Check for the JSON error in logs
     assert 'Error loading settings: Expecting value' in caplog.text
+
+
+def _cli_args(**kwargs):
+    args = MagicMock()
+    for attr in ['rate', 'volume', 'voice', 'pause_seconds', 'page_size', 'delay_seconds', 'num_retries']:
+        setattr(args, attr, kwargs.get(attr))
+    return args
+
+
+def test_initialize_configuration_merges_partial_config(tmp_path):
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(json.dumps({'audio': {'rate': 200}}), encoding='utf-8')
+
+    with patch("audioarxiv.tools.main.user_config_dir", return_value=str(tmp_path)):
+        settings, _ = initialize_configuration(_cli_args(num_retries=5))
+
+    assert settings['audio'] == {'rate': 200, 'volume': 0.9, 'voice': None, 'pause_seconds': 0.1}
+    assert settings['paper'] == {'page_size': 100, 'delay_seconds': 3.0, 'num_retries': 5}
+    assert json.loads(config_path.read_text(encoding='utf-8')) == settings
+
+
+def test_initialize_configuration_saves_new_config_once(tmp_path):
+    with patch("audioarxiv.tools.main.user_config_dir", return_value=str(tmp_path)), \
+            patch("audioarxiv.tools.main.save_settings") as mock_save_settings:
+        settings, config_path = initialize_configuration(_cli_args(rate=180))
+
+    assert settings['audio']['rate'] == 180
+    mock_save_settings.assert_called_once_with(config_path, settings)
+
+
+def test_initialize_configuration_invalid_config_uses_defaults(tmp_path, caplog):
+    config_path = tmp_path / 'config.json'
+    config_path.write_text(json.dumps({'audio': {'rate': 200, 'pitch': 1}}), encoding='utf-8')
+
+    logger = logging.getLogger('audioarxiv')
+    logger.propagate = True
+
+    with patch("audioarxiv.tools.main.user_config_dir", return_value=str(tmp_path)):
+        with caplog.at_level(logging.ERROR, logger='audioarxiv'):
+            settings, _ = initialize_configuration(_cli_args())
+
+    assert settings['audio']['rate'] == 140
+    assert 'Error loading settings' in caplog.text
+
+
+@patch("time.sleep")
+@patch("audioarxiv.tools.main.Audio")
+@patch("audioarxiv.tools.main.Paper")
+@patch("audioarxiv.tools.main.argparse.ArgumentParser.parse_args")
+def test_main_reads_sections_without_fixed_delay(mock_parse_args, mock_Paper, mock_Audio, mock_sleep):
+    mock_parse_args.return_value = MagicMock(id="1234.5678", output=None, list_voices=False)
+    mock_Paper.return_value.iter_sections.return_value = iter([
+        {'header': "Introduction", 'content': ["First paragraph.", "Second paragraph."]},
+    ])
+
+    with patch("audioarxiv.tools.main.initialize_configuration") as mock_init_config:
+        mock_init_config.return_value = ({"audio": {}, "paper": {}}, "mock/config/path")
+        main()
+
+    read_article = mock_Audio.return_value.read_article
+    assert [c.args[0] for c in read_article.call_args_list] == ["Introduction", "First paragraph.", "Second paragraph."]
+    mock_sleep.assert_not_called()
+
+
+@patch("audioarxiv.tools.main.Paper")
+@patch("audioarxiv.tools.main.argparse.ArgumentParser.parse_args")
+def test_main_searches_while_engine_initializes(mock_parse_args, mock_Paper):
+    mock_parse_args.return_value = MagicMock(id="1234.5678", output=None, list_voices=False)
+    threads = {}
+    mock_Paper.return_value.search_by_arxiv_id.side_effect = \
+        lambda arxiv_id: threads.setdefault('search', threading.current_thread())
+    mock_Paper.return_value.iter_sections.return_value = iter([])
+
+    class FakeAudio:
+        def __init__(self, **kwargs):
+            pass
+
+        def warm_up(self):
+            threads['engine'] = threading.current_thread()
+            return MagicMock()
+
+    with patch("audioarxiv.tools.main.Audio", FakeAudio), \
+            patch("audioarxiv.tools.main.initialize_configuration") as mock_init_config:
+        mock_init_config.return_value = ({"audio": {}, "paper": {}}, "mock/config/path")
+        main()
+
+    mock_Paper.return_value.search_by_arxiv_id.assert_called_once_with(arxiv_id="1234.5678")
+    assert threads['engine'] is threading.main_thread()
+    assert threads['search'] is not threading.main_thread()
+    # The search does not keep the process alive when the user interrupts it.
+    assert threads['search'].daemon
+
+
+def test_run_in_background_returns_result():
+    wait = run_in_background(lambda x, y=0: x + y, 1, y=2)
+    assert wait() == 3
+
+
+def test_run_in_background_reraises_error():
+    def fail():
+        raise ValueError("search failed")
+
+    wait = run_in_background(fail)
+    with pytest.raises(ValueError, match="search failed"):
+        wait()
+
+
+def test_run_in_background_reraises_base_exception():
+    def leave():
+        raise SystemExit(2)
+
+    wait = run_in_background(leave)
+    with pytest.raises(SystemExit):
+        wait()
+
+
+def test_prefetch_yields_items_in_order():
+    assert list(prefetch(iter(range(10)), maxsize=2)) == list(range(10))
+
+
+def test_prefetch_reraises_producer_error():
+    def failing():
+        yield 1
+        raise ValueError("parse failed")
+
+    items = prefetch(failing())
+    assert next(items) == 1
+    with pytest.raises(ValueError, match="parse failed"):
+        next(items)
+
+
+def test_prefetch_reraises_producer_base_exception():
+    def leaving():
+        yield 1
+        raise SystemExit(2)
+
+    items = prefetch(leaving())
+    assert next(items) == 1
+    with pytest.raises(SystemExit):
+        next(items)
+
+
+def test_update_settings_returns_changes():
+    settings = {'rate': 140, 'volume': 0.9, 'voice': None}
+    changes = update_settings(settings, _cli_args(rate=140, volume=0.5))
+    assert changes == {'volume': 0.5}
+    assert settings == {'rate': 140, 'volume': 0.5, 'voice': None}